@@ -5,7 +5,11 @@ A GUI helper for running scripts and managing metadata.
 Styled to match VibeFoundry Assistant (light theme)
 """
 
+import importlib.util
+import json
 import os
+import queue
+import shutil
 import sys
 import subprocess
 import threading
@@ -13,18 +17,278 @@ import time
 import webbrowser
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, font
+from collections import deque
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
 
-# Check for pandas
+# Optional dependencies - heavy ones are only checked here and imported on
+# first use, so they don't slow down startup
+def _has_module(name):
+    return importlib.util.find_spec(name) is not None
+
+
+HAS_PANDAS = _has_module("pandas")
+HAS_PYARROW = _has_module("pyarrow")  # Parquet footers, fast CSV reads
+HAS_OPENPYXL = _has_module("openpyxl")  # Streaming xlsx reads
+
+# Check for watchdog (native file system notifications)
 try:
-    import pandas as pd
-    HAS_PANDAS = True
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+    HAS_WATCHDOG = True
 except ImportError:
-    HAS_PANDAS = False
+    FileSystemEventHandler = object
+    HAS_WATCHDOG = False
+
+# Quiet window for coalescing bursts of file changes
+DEBOUNCE_MS = 500
+
+# Output area limits
+MAX_OUTPUT_LINES = 5000
+LOG_FLUSH_MS = 50
+
+# Scripts list check marks
+CHECKED = "☑"
+UNCHECKED = "☐"
+
+# Maximum script run time in seconds
+SCRIPT_TIMEOUT = 300
+
+# Files included in metadata scans
+DATA_EXTENSIONS = frozenset({'.csv', '.xlsx', '.xls', '.parquet'})
+
+# Rows sampled to infer column dtypes without loading whole files
+SCHEMA_SAMPLE_ROWS = 1000
+CSV_COUNT_CHUNK_ROWS = 100_000
+# Infer xlsx dtypes from a pandas sample (slower) instead of header-only
+XLSX_SAMPLE_DTYPES = False
+
+# Filesystem types that don't deliver native change events
+NETWORK_FS_TYPES = {
+    'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'afpfs', 'webdav',
+    'fuse.sshfs', 'sshfs', '9p', 'afs',
+}
+
+
+def _is_network_mount(path):
+    """Best-effort check whether path lives on a network filesystem"""
+    path = os.path.realpath(path)
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            drive = os.path.splitdrive(path)[0] + "\\"
+            return ctypes.windll.kernel32.GetDriveTypeW(drive) == 4  # DRIVE_REMOTE
+
+        if sys.platform.startswith("linux"):
+            with open("/proc/mounts") as f:
+                mounts = [line.split()[1:3] for line in f]
+        else:
+            # macOS/BSD: "//user@host/share on /Volumes/share (smbfs, ...)"
+            out = subprocess.run(["mount"], capture_output=True, text=True, timeout=5).stdout
+            mounts = []
+            for line in out.splitlines():
+                if " on " in line and " (" in line:
+                    mount_point = line.split(" on ", 1)[1].rsplit(" (", 1)
+                    mounts.append([mount_point[0], mount_point[1].split(",")[0].rstrip(")")])
+
+        # Longest matching mount point wins
+        best, best_type = "", ""
+        for mount_point, fs_type in mounts:
+            mount_point = mount_point.replace("\\040", " ")
+            if (path == mount_point or path.startswith(mount_point.rstrip("/") + "/")) \
+                    and len(mount_point) > len(best):
+                best, best_type = mount_point, fs_type
+        return best_type in NETWORK_FS_TYPES
+    except Exception:
+        return False
+
+
+def _iter_files(root):
+    """Yield os.DirEntry for every file under root, including symlinked
+    files; symlinked directories aren't followed so they can't loop"""
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue  # Removed or unreadable since it was listed
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def _read_csv_schema(filepath):
+    """Return (schema DataFrame, row count) for a CSV file"""
+    import pandas as pd
+
+    # Dtypes come from a pandas sample so they match what scripts will see
+    df = pd.read_csv(filepath, nrows=SCHEMA_SAMPLE_ROWS)
+    if len(df.index) < SCHEMA_SAMPLE_ROWS:
+        return df, len(df.index)
+
+    if HAS_PYARROW:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+
+        try:
+            # Stream the first column as plain strings to count rows
+            read = pacsv.ReadOptions(skip_rows=1, autogenerate_column_names=True)
+            convert = pacsv.ConvertOptions(include_columns=['f0'], column_types={'f0': pa.string()})
+            parse = pacsv.ParseOptions(newlines_in_values=True)  # Quoted newlines, as pandas
+            reader = pacsv.open_csv(
+                str(filepath), read_options=read, parse_options=parse, convert_options=convert
+            )
+            return df, sum(batch.num_rows for batch in reader)
+        except pa.ArrowInvalid:
+            pass  # Fall back to pandas
+
+    # Stream a single column to count rows with bounded memory
+    chunks = pd.read_csv(filepath, usecols=[0], chunksize=CSV_COUNT_CHUNK_ROWS)
+    return df, sum(len(chunk.index) for chunk in chunks)
+
+
+def _read_schema(filepath):
+    """Return (schema DataFrame, row count) without loading the whole file"""
+    import pandas as pd
+
+    suffix = filepath.suffix.lower()
+    if suffix == '.csv':
+        return _read_csv_schema(filepath)
+
+    if suffix == '.xlsx' and HAS_OPENPYXL:
+        from openpyxl import load_workbook
+
+        wb = load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            ws = wb.worksheets[0]
+            header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            if ws.max_row is None:
+                # No stored dimensions - count by streaming
+                ws.reset_dimensions()
+                row_count = sum(1 for _ in ws.iter_rows(values_only=True))
+            else:
+                row_count = ws.max_row
+        finally:
+            wb.close()
+        row_count = max(row_count - 1, 0)  # Exclude header row
+
+        if XLSX_SAMPLE_DTYPES:
+            return pd.read_excel(filepath, nrows=SCHEMA_SAMPLE_ROWS), row_count
+
+        # Dtypes are unknown without reading cells - report them as object
+        columns = [
+            col if col is not None else f"Unnamed: {i}"
+            for i, col in enumerate(header)
+        ]
+        return pd.DataFrame(columns=columns, dtype=object), row_count
+
+    if suffix in ['.xlsx', '.xls']:
+        df = pd.read_excel(filepath)
+        return df, len(df.index)
+
+    if suffix == '.parquet':
+        if HAS_PYARROW:
+            import pyarrow.parquet as pq
+
+            # Row count and schema come from the footer
+            pf = pq.ParquetFile(str(filepath))
+            return pf.schema_arrow.empty_table().to_pandas(), pf.metadata.num_rows
+        df = pd.read_parquet(filepath)
+        return df, len(df.index)
+
+    return None
+
+
+def _parse_one(filepath, folder):
+    """Build the (text block, record) for one data file (runs in a worker process)"""
+    filepath = Path(filepath)
+    block = []
+    record = None
+    try:
+        schema = _read_schema(filepath)
+        if schema is None:
+            return None
+        df, row_count = schema
+
+        size_mb = filepath.stat().st_size / (1024 * 1024)
+        rel_path = filepath.relative_to(folder)
+        block.append(f"File: {rel_path}")
+        block.append(f"  Absolute Path: {filepath}")
+        block.append(f"  Size: {size_mb:.2f} MB")
+        block.append(f"  Rows: {row_count}")
+        block.append(f"  Columns ({len(df.columns)}):")
+
+        for col, dtype in df.dtypes.items():
+            block.append(f"    - {col} ({dtype})")
+
+        block.append("")
+
+        record = {
+            'path': str(filepath),
+            'rel_path': str(rel_path),
+            'size_mb': round(size_mb, 2),
+            'rows': int(row_count),
+            'columns': tuple(str(col) for col in df.columns),
+            'dtypes': tuple(str(dtype) for dtype in df.dtypes),
+        }
+
+    except Exception as e:
+        block = [
+            f"File: {filepath.name}",
+            f"  Error reading: {e}",
+            "",
+        ]
+
+    return "\n".join(block), record
+
+
+class _ChangeHandler(FileSystemEventHandler):
+    """Forward watchdog events to the ScriptRunner"""
+
+    def __init__(self, runner):
+        super().__init__()
+        self.runner = runner
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        self.runner._on_file_event(event.src_path)
+        dest = getattr(event, 'dest_path', None)
+        if dest:
+            self.runner._on_file_event(dest)
 
 
 class ScriptRunner:
+    __slots__ = (
+        # Window and widgets
+        'root', 'folder_label', 'auto_run_check', 'script_count_label',
+        'scripts_frame', 'scripts_tree', '_no_scripts_label', 'output_text', 'status_label',
+        # Paths
+        'project_folder', 'scripts_folder', 'input_folder', 'output_folder',
+        'app_folder', 'meta_folder',
+        # Script tracking
+        '_script_labels', 'script_mtimes',
+        # Metadata caches
+        '_meta_cache', '_schema_ids', '_last_meta_hash',
+        # Auto-run state
+        'auto_run_var',
+        # File watching state
+        'watching', '_polling', 'observers', 'last_input_scan', 'last_output_scan',
+        'last_refresh_time', '_pending_after_id', '_pending_data', '_pending_scripts',
+        # Output batching
+        '_log_queue', '_log_after_id',
+        # Background work
+        '_work_q', '_worker', '_script_pool', '_parse_pool', '_running_procs', '_procs_lock', '_closing',
+        # Browser
+        '_browser_cmd',
+    )
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Script Runner")
@@ -50,18 +314,49 @@ class ScriptRunner:
         self.meta_folder = None
 
         # Script tracking
-        self.script_vars = {}
+        self._script_labels = {}  # Treeview iid (script path) -> relative path
         self.script_mtimes = {}
 
+        # Metadata keyed by path -> (mtime_ns, size, block, record)
+        self._meta_cache = {}
+        # Distinct (columns, dtypes) schemas -> schema id
+        self._schema_ids = {}
+        # Fingerprints of the last metadata written, by file path
+        self._last_meta_hash = {}
+
         # Auto-run state
         self.auto_run_var = tk.BooleanVar(value=False)
 
         # File watching state
         self.watching = False
+        self._polling = False  # Fallback watch loop running
+        self.observers = []
         self.last_input_scan = {}
         self.last_output_scan = {}
         self.last_refresh_time = 0  # Debounce refreshes
 
+        # Pending changes, flushed once per burst
+        self._pending_after_id = None
+        self._pending_data = False
+        self._pending_scripts = set()
+
+        # Output batching
+        self._log_queue = deque()
+        self._log_after_id = None
+
+        # Background work: one worker for metadata, a small pool for scripts
+        self._work_q = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+        self._script_pool = ThreadPoolExecutor(max_workers=2)
+        self._parse_pool = None  # Metadata parsing processes, started on first use
+        self._running_procs = set()
+        self._procs_lock = threading.Lock()
+        self._closing = False
+
+        # App-mode browser command template
+        self._browser_cmd = self._resolve_browser()
+
         # Configure ttk styles
         self._configure_styles()
 
@@ -129,6 +424,21 @@ class ScriptRunner:
             background=[('active', bg)]
         )
 
+        # Scripts list
+        style.configure('Treeview',
+            background=bg,
+            fieldbackground=bg,
+            foreground=text,
+            font=('Inter', 14),
+            rowheight=32,
+            borderwidth=0
+        )
+        style.map('Treeview',
+            background=[('selected', bg_alt)],
+            foreground=[('selected', text)]
+        )
+        style.layout('Treeview', [('Treeview.treearea', {'sticky': 'nswe'})])
+
         # Scrollbar
         style.configure('TScrollbar', background=bg_alt, troughcolor=bg)
 
@@ -199,10 +509,23 @@ class ScriptRunner:
         scripts_container = ttk.Frame(self.root)
         scripts_container.pack(fill=tk.BOTH, expand=True)
 
-        # Use a simple listbox-style approach
+        # One Treeview row per script; selected rows are the checked scripts
         self.scripts_frame = ttk.Frame(scripts_container)
         self.scripts_frame.pack(fill=tk.BOTH, expand=True, padx=0, pady=8)
 
+        self.scripts_tree = ttk.Treeview(self.scripts_frame, show='tree', selectmode='extended')
+        scripts_scroll = ttk.Scrollbar(self.scripts_frame, orient="vertical", command=self.scripts_tree.yview)
+        self.scripts_tree.configure(yscrollcommand=scripts_scroll.set)
+
+        self.scripts_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(16, 0))
+        scripts_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.scripts_tree.bind('<Button-1>', self._toggle_script)
+        self.scripts_tree.bind('<<TreeviewSelect>>', self._update_script_marks)
+
+        # Shown over the empty list
+        self._no_scripts_label = ttk.Label(self.scripts_frame, text="No scripts in app_folder/scripts/", style='Muted.TLabel')
+
         # Separator
         sep4 = tk.Frame(self.root, height=1, bg='#b8d4f0')
         sep4.pack(fill=tk.X)
@@ -247,10 +570,34 @@ class ScriptRunner:
         self.status_label.pack(side=tk.LEFT)
 
     def _log(self, message):
-        """Add message to output area"""
-        self.output_text.insert(tk.END, f"{message}\n")
+        """Queue message for the output area"""
+        self._log_queue.append(f"{message}\n")
+        if self._log_after_id is None:
+            self._log_after_id = self.root.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        """Write queued messages in one update and trim old lines"""
+        self._log_after_id = None
+        messages = []
+        while self._log_queue:
+            messages.append(self._log_queue.popleft())
+        self.output_text.insert(tk.END, "".join(messages))
+
+        line_count = int(self.output_text.index('end-1c').split('.')[0])
+        if line_count > MAX_OUTPUT_LINES:
+            self.output_text.delete('1.0', f'{line_count - MAX_OUTPUT_LINES}.0')
+
         self.output_text.see(tk.END)
 
+    def _post(self, delay, fn):
+        """Schedule fn on the UI thread from a background thread; dropped once closing"""
+        if self._closing:
+            return
+        try:
+            self.root.after(delay, fn)
+        except (RuntimeError, tk.TclError):
+            pass  # Window destroyed meanwhile
+
     def _set_status(self, message):
         """Update status bar"""
         self.status_label.config(text=message)
@@ -293,46 +640,59 @@ class ScriptRunner:
 
     def _refresh_scripts(self):
         """Scan scripts folder and update display"""
-        # Clear existing
-        for widget in self.scripts_frame.winfo_children():
-            widget.destroy()
-        self.script_vars.clear()
+        if self.scripts_folder and self.scripts_folder.exists():
+            scripts = sorted(self.scripts_folder.glob("**/*.py"))
+        else:
+            scripts = []
 
-        if not self.scripts_folder or not self.scripts_folder.exists():
-            return
+        new_keys = {sys.intern(str(p)) for p in scripts}
+        old_keys = set(self._script_labels)
 
-        scripts = sorted(self.scripts_folder.glob("**/*.py"))
+        # Remove scripts that no longer exist
+        for script_key in old_keys - new_keys:
+            self.scripts_tree.delete(script_key)
+            del self._script_labels[script_key]
+            self.script_mtimes.pop(script_key, None)
 
-        for script in scripts:
-            rel_path = script.relative_to(self.scripts_folder)
-            script_key = str(script)
-
-            # Create variable for this script
-            var = tk.BooleanVar(value=False)
-            self.script_vars[script_key] = var
+        # Add new scripts in sorted position, leaving existing rows (and their
+        # selection) untouched
+        for index, script in enumerate(scripts):
+            script_key = sys.intern(str(script))
 
             # Track modification time
             self.script_mtimes[script_key] = script.stat().st_mtime
 
-            # Create checkbutton directly in scripts_frame
-            cb = ttk.Checkbutton(
-                self.scripts_frame,
-                text=f"  {rel_path}",
-                variable=var,
-                style='TCheckbutton'
-            )
-            cb.pack(fill=tk.X, padx=16, pady=6, anchor='w')
+            if script_key not in old_keys:
+                label = str(script.relative_to(self.scripts_folder))
+                self._script_labels[script_key] = label
+                self.scripts_tree.insert('', index, iid=script_key, text=f"{UNCHECKED}  {label}")
 
         count = len(scripts)
         self.script_count_label.config(text=f"{count} script{'s' if count != 1 else ''}")
 
-        if not scripts:
-            no_scripts = ttk.Label(self.scripts_frame, text="No scripts in app_folder/scripts/", style='Muted.TLabel')
-            no_scripts.pack(pady=20)
+        if scripts:
+            self._no_scripts_label.place_forget()
+        else:
+            self._no_scripts_label.place(relx=0.5, y=20, anchor='n')
+
+    def _toggle_script(self, event):
+        """Toggle a script's checked state on click"""
+        script_key = self.scripts_tree.identify_row(event.y)
+        if script_key:
+            self.scripts_tree.selection_toggle(script_key)
+        return "break"  # Don't let the default binding replace the selection
+
+    def _update_script_marks(self, event=None):
+        """Show a check mark on selected scripts"""
+        selected = set(self.scripts_tree.selection())
+        for script_key, label in self._script_labels.items():
+            mark = CHECKED if script_key in selected else UNCHECKED
+            self.scripts_tree.item(script_key, text=f"{mark}  {label}")
 
     def _run_selected_script(self):
         """Run all selected scripts"""
-        selected = [path for path, var in self.script_vars.items() if var.get()]
+        selected = set(self.scripts_tree.selection())
+        selected = [path for path in self.scripts_tree.get_children() if path in selected]
 
         if not selected:
             messagebox.showinfo("No Selection", "Please select at least one script to run")
@@ -355,36 +715,67 @@ class ScriptRunner:
 
         self._set_status(f"Running {script.name}...")
 
-        def run():
+        def stream(proc):
+            # Forward output line by line as the script produces it
             try:
-                result = subprocess.run(
-                    [sys.executable, str(script)],
-                    cwd=str(self.project_folder),
-                    capture_output=True,
-                    text=True,
-                    timeout=300
-                )
+                for line in proc.stdout:
+                    self._post(0, lambda l=line: self._log(l.rstrip()))
+            except Exception as e:
+                msg = f"⚠️ Output error: {e}"
+                self._post(0, lambda: self._log(msg))
+                # Keep draining so the script never blocks on a full pipe
+                try:
+                    while proc.stdout.read(65536):
+                        pass
+                except Exception:
+                    pass
 
-                if result.stdout:
-                    self.root.after(0, lambda: self._log(result.stdout.strip()))
-                if result.stderr:
-                    self.root.after(0, lambda: self._log(f"⚠️ {result.stderr.strip()}"))
+        def run():
+            try:
+                with self._procs_lock:
+                    if self._closing:
+                        return
+                    proc = subprocess.Popen(
+                        [sys.executable, "-u", str(script)],  # Unbuffered, so output arrives live
+                        cwd=str(self.project_folder),
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        text=True,
+                        errors="replace",
+                        bufsize=-1
+                    )
+                    self._running_procs.add(proc)
+                reader = threading.Thread(target=stream, args=(proc,), daemon=True)
+                reader.start()
 
-                status = "✓ Completed" if result.returncode == 0 else f"✗ Failed (code {result.returncode})"
-                self.root.after(0, lambda: self._log(f"\n{status}"))
-                self.root.after(0, lambda: self._set_status(status))
+                try:
+                    returncode = proc.wait(timeout=SCRIPT_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+                    reader.join(timeout=5)  # Children may still hold the pipe
+                    raise
+                finally:
+                    self._running_procs.discard(proc)
+                reader.join(timeout=5)  # Children may still hold the pipe
+
+                status = "✓ Completed" if returncode == 0 else f"✗ Failed (code {returncode})"
+                self._post(0, lambda: self._log(f"\n{status}"))
+                self._post(0, lambda: self._set_status(status))
 
                 # Regenerate metadata after script runs
-                self.root.after(100, self._generate_metadata)
+                self._post(100, self._generate_metadata)
 
             except subprocess.TimeoutExpired:
-                self.root.after(0, lambda: self._log("⏱ Script timed out (5 min limit)"))
-                self.root.after(0, lambda: self._set_status("Timed out"))
+                self._post(0, lambda: self._log("⏱ Script timed out (5 min limit)"))
+                self._post(0, lambda: self._set_status("Timed out"))
             except Exception as e:
-                self.root.after(0, lambda: self._log(f"❌ Error: {e}"))
-                self.root.after(0, lambda: self._set_status("Error"))
+                msg = f"❌ Error: {e}"
+                self._post(0, lambda: self._log(msg))
+                self._post(0, lambda: self._set_status("Error"))
 
-        threading.Thread(target=run, daemon=True).start()
+        # Scripts may legitimately run side by side
+        self._script_pool.submit(run)
 
     def _generate_metadata(self):
         """Generate metadata files for input and output folders"""
@@ -397,26 +788,142 @@ class ScriptRunner:
 
         def generate():
             try:
+                changed = False
+
                 # Generate input metadata
-                input_meta = self._scan_folder_metadata(self.input_folder, "Input Folder")
-                input_path = self.meta_folder / "input_metadata.txt"
-                input_path.write_text(input_meta)
+                input_meta, input_records = self._scan_folder_metadata(self.input_folder, "Input Folder")
+                changed |= self._write_metadata_text(input_meta, self.meta_folder / "input_metadata.txt")
+                changed |= self._write_metadata_parquet(
+                    input_records,
+                    self.meta_folder / "input_metadata.parquet",
+                    self.meta_folder / "input_schemas.parquet"
+                )
 
                 # Generate output metadata
-                output_meta = self._scan_folder_metadata(self.output_folder, "Output Folder")
-                output_path = self.meta_folder / "output_metadata.txt"
-                output_path.write_text(output_meta)
+                output_meta, output_records = self._scan_folder_metadata(self.output_folder, "Output Folder")
+                changed |= self._write_metadata_text(output_meta, self.meta_folder / "output_metadata.txt")
+                changed |= self._write_metadata_parquet(
+                    output_records,
+                    self.meta_folder / "output_metadata.parquet",
+                    self.meta_folder / "output_schemas.parquet"
+                )
 
-                self.root.after(0, lambda: self._log("✓ Metadata updated"))
-                self.root.after(0, lambda: self._set_status("Metadata updated"))
+                status = "Metadata updated" if changed else "Metadata unchanged"
+                self._post(0, lambda: self._log(f"✓ {status}"))
+                self._post(0, lambda: self._set_status(status))
 
             except Exception as e:
-                self.root.after(0, lambda: self._log(f"❌ Metadata error: {e}"))
+                msg = f"❌ Metadata error: {e}"
+                self._post(0, lambda: self._log(msg))
+
+        # Only the latest pending regeneration runs
+        self._submit(generate, key='metadata')
+
+    def _submit(self, fn, key=None):
+        """Queue fn for the background worker; a newer job with the same key replaces it"""
+        self._work_q.put((key, fn))
+
+    def _worker_loop(self):
+        """Run queued background jobs one at a time"""
+        while True:
+            jobs = [self._work_q.get()]
+            # Drain whatever queued up while the last job ran
+            while True:
+                try:
+                    jobs.append(self._work_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            if None in jobs:
+                return  # Shut down
+
+            # Collapse duplicates, keeping the latest of each key in its position
+            latest = {key: i for i, (key, _) in enumerate(jobs) if key is not None}
+            for i, (key, fn) in enumerate(jobs):
+                if key is not None and latest[key] != i:
+                    continue
+                try:
+                    fn()
+                except Exception as e:
+                    print(f"Worker error: {e}")
+
+    def _dedupe_schema(self, record):
+        """Replace a record's columns/dtypes with a shared schema id"""
+        intern = sys.intern
+        schema = (
+            tuple(intern(col) for col in record.pop('columns')),
+            tuple(intern(dtype) for dtype in record.pop('dtypes')),
+        )
+        record['schema_id'] = self._schema_ids.setdefault(schema, len(self._schema_ids))
+        return record
+
+    def _replace_if_changed(self, path, fingerprint, write):
+        """Atomically rewrite path with write(tmp_path), unless its content is unchanged"""
+        key = str(path)
+        if self._last_meta_hash.get(key) == fingerprint and path.exists():
+            return False
+
+        # Readers never see a partially written file
+        tmp = path.with_name(path.name + ".tmp")
+        write(tmp)
+        os.replace(tmp, path)
+        self._last_meta_hash[key] = fingerprint
+        return True
+
+    def _write_metadata_text(self, text, path):
+        """Write a metadata text file; returns whether it changed"""
+        # The timestamp alone doesn't count as a change
+        body = "\n".join(line for line in text.split("\n") if not line.startswith("Generated: "))
+        return self._replace_if_changed(path, hash(body), lambda tmp: tmp.write_text(text))
+
+    def _get_parse_pool(self):
+        """Return the long-lived metadata parsing pool, starting it on first use"""
+        with self._procs_lock:
+            if self._closing:
+                raise CancelledError()
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+            return self._parse_pool
+
+    def _stop_parse_pool(self, pool):
+        """Cancel queued parses and kill in-flight ones so they don't hold up exit"""
+        terminate = getattr(pool, 'terminate_workers', None)  # Python 3.14+
+        if terminate is not None:
+            terminate()
+            return
+        processes = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+
+    def _write_metadata_parquet(self, records, path, schemas_path):
+        """Write one row per data file, plus one row per distinct schema"""
+        if not HAS_PYARROW:
+            return False
+        import pandas as pd
+
+        columns = ['path', 'rel_path', 'size_mb', 'rows', 'schema_id']
+        rows = [tuple(record[col] for col in columns) for record in records]
+        df = pd.DataFrame(rows, columns=columns)
+        changed = self._replace_if_changed(
+            path, hash(tuple(rows)),
+            lambda tmp: df.to_parquet(tmp, index=False)
+        )
 
-        threading.Thread(target=generate, daemon=True).start()
+        used = set(df['schema_id'])
+        schemas = [
+            (schema_id, json.dumps([list(col) for col in zip(*schema)]))
+            for schema, schema_id in self._schema_ids.items() if schema_id in used
+        ]
+        schemas_df = pd.DataFrame(schemas, columns=['schema_id', 'cols'])
+        changed |= self._replace_if_changed(
+            schemas_path, hash(tuple(schemas)),
+            lambda tmp: schemas_df.to_parquet(tmp, index=False)
+        )
+        return changed
 
     def _scan_folder_metadata(self, folder, title):
-        """Scan a folder and generate metadata text"""
+        """Scan a folder and return (metadata text, per-file records)"""
         lines = [
             f"{title} Metadata",
             f"Folder: {folder}",
@@ -425,63 +932,101 @@ class ScriptRunner:
             ""
         ]
 
-        data_extensions = ['.csv', '.xlsx', '.xls', '.parquet']
-        data_files = []
-        for ext in data_extensions:
-            data_files.extend(folder.glob(f"**/*{ext}"))
-
-        if not data_files:
-            lines.append("No data files found.")
-            return "\n".join(lines)
+        # One walk, dispatching on suffix
+        data_files = [
+            Path(entry.path) for entry in _iter_files(folder)
+            if os.path.splitext(entry.name)[1].lower() in DATA_EXTENSIONS
+        ]
 
+        results = {}
+        misses = []
         for filepath in sorted(data_files):
+            key = str(filepath)
             try:
-                size_mb = filepath.stat().st_size / (1024 * 1024)
-
-                if filepath.suffix == '.csv':
-                    df = pd.read_csv(filepath, nrows=0)
-                    df_full = pd.read_csv(filepath)
-                    row_count = len(df_full)
-                elif filepath.suffix in ['.xlsx', '.xls']:
-                    df = pd.read_excel(filepath, nrows=0)
-                    df_full = pd.read_excel(filepath)
-                    row_count = len(df_full)
-                elif filepath.suffix == '.parquet':
-                    df = pd.read_parquet(filepath)
-                    row_count = len(df)
-                else:
-                    continue
-
-                rel_path = filepath.relative_to(folder)
-                lines.append(f"File: {rel_path}")
-                lines.append(f"  Absolute Path: {filepath}")
-                lines.append(f"  Size: {size_mb:.2f} MB")
-                lines.append(f"  Rows: {row_count}")
-                lines.append(f"  Columns ({len(df.columns)}):")
-
-                for col in df.columns:
-                    dtype = str(df[col].dtype) if col in df.columns else "unknown"
-                    lines.append(f"    - {col} ({dtype})")
-
-                lines.append("")
+                stat = filepath.stat()
+            except OSError:
+                continue  # Removed since the walk
+
+            # Reuse the block for files unchanged since the last scan
+            cached = self._meta_cache.get(key)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                results[key] = cached[2:]
+            else:
+                results[key] = None
+                misses.append((key, stat))
+
+        # Parse changed files in parallel - the work is CPU-bound in pandas
+        paths = [key for key, _ in misses]
+        if len(paths) > 1:
+            pool = self._get_parse_pool()
+            futures = [pool.submit(_parse_one, path, str(folder)) for path in paths]
+            parsed = []
+            try:
+                for future in futures:
+                    if self._closing:
+                        raise CancelledError()
+                    parsed.append(future.result())
+            except BrokenProcessPool:
+                # A worker died (e.g. out of memory) - start a fresh pool next time
+                self._parse_pool = None
+                raise
+            finally:
+                for future in futures:
+                    future.cancel()
+        else:
+            parsed = [_parse_one(path, str(folder)) for path in paths]
+
+        for (key, stat), result in zip(misses, parsed):
+            if result is not None and result[1] is not None:
+                result = (result[0], self._dedupe_schema(result[1]))
+            results[key] = result
+            if result is not None:
+                self._meta_cache[key] = (stat.st_mtime_ns, stat.st_size, *result)
+
+        records = []
+        for result in results.values():
+            if result is None:
+                continue
+            block, record = result
+            lines.append(block)
+            if record is not None:
+                records.append(record)
+
+        # Evict files that disappeared from this folder
+        prefix = str(folder) + os.sep
+        for key in [k for k in self._meta_cache if k.startswith(prefix) and k not in results]:
+            del self._meta_cache[key]
 
-            except Exception as e:
-                lines.append(f"File: {filepath.name}")
-                lines.append(f"  Error reading: {e}")
-                lines.append("")
+        if not data_files:
+            lines.append("No data files found.")
 
-        return "\n".join(lines)
+        return "\n".join(lines), records
 
     def _start_watching(self):
-        """Start watching for file changes"""
-        if self.watching:
-            return
+        """Start watching for file changes, or re-point watching at a newly opened project"""
         self.watching = True
 
+        # Drop the previous project's observers and baseline
+        self._stop_observers()
+        self.last_input_scan.clear()
+        self.last_output_scan.clear()
         self._scan_data_folders()
 
+        if HAS_WATCHDOG and self._start_observers():
+            self._polling = False
+            return
+
+        self._start_polling()
+
+    def _start_polling(self):
+        """Fall back to checking the folders once per second"""
+        # The polling loop reads the current folders on every tick
+        if self._polling:
+            return
+        self._polling = True
+
         def watch_loop():
-            while self.watching:
+            while self.watching and self._polling:
                 try:
                     self._check_for_changes()
                 except Exception as e:
@@ -490,48 +1035,130 @@ class ScriptRunner:
 
         threading.Thread(target=watch_loop, daemon=True).start()
 
+    def _stop_observers(self):
+        """Stop and join all folder observers"""
+        for observer in self.observers:
+            observer.stop()
+        for observer in self.observers:
+            # Bounded: an observer thread may be waiting on the Tk main loop
+            observer.join(timeout=1)
+        self.observers.clear()
+
+    def _start_observers(self):
+        """Watch folders with native OS notifications (polling on network mounts).
+        Returns False if the folders couldn't be watched at all."""
+        handler = _ChangeHandler(self)
+        for folder in [self.input_folder, self.output_folder, self.scripts_folder]:
+            if not folder or not folder.exists():
+                continue
+            factories = [lambda: PollingObserver(timeout=30)]
+            if not _is_network_mount(folder):
+                factories.insert(0, Observer)
+            for factory in factories:
+                observer = factory()
+                try:
+                    observer.schedule(handler, str(folder), recursive=True)
+                    observer.daemon = True
+                    observer.start()
+                except OSError as e:
+                    # e.g. inotify watch limit reached on a large tree
+                    self._log(f"⚠️ Can't watch {folder.name}: {e}")
+                    continue
+                self.observers.append(observer)
+                break
+            else:
+                self._stop_observers()
+                return False
+        return True
+
+    def _on_file_event(self, path):
+        """Handle a single file event from the observers"""
+        if not self.watching:
+            return
+        path = sys.intern(path)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            mtime = None  # Deleted or moved away
+
+        def update(scan):
+            if mtime is None:
+                return scan.pop(path, None) is not None
+            if scan.get(path) == mtime:
+                return False
+            scan[path] = mtime
+            return True
+
+        data_changed = False
+        scripts_changed = []
+
+        if self.input_folder and path.startswith(str(self.input_folder) + os.sep):
+            data_changed = update(self.last_input_scan)
+        elif self.output_folder and path.startswith(str(self.output_folder) + os.sep):
+            data_changed = update(self.last_output_scan)
+        elif self.scripts_folder and path.startswith(str(self.scripts_folder) + os.sep):
+            # Scripts are only tracked for auto-run
+            if not self.auto_run_var.get() or not path.endswith(".py") or mtime is None:
+                return
+            if path in self.script_mtimes:
+                if self.script_mtimes[path] != mtime:
+                    self.script_mtimes[path] = mtime
+                    scripts_changed.append(path)
+            else:
+                # New script found - add to tracking but only refresh once
+                self.script_mtimes[path] = mtime
+                current_time = time.time()
+                if current_time - self.last_refresh_time > 2:  # Debounce 2 seconds
+                    self.last_refresh_time = current_time
+                    self._post(0, self._refresh_scripts)
+
+        self._notify_changes(data_changed, scripts_changed)
+
     def _scan_data_folders(self):
         """Scan input/output folders and record file times"""
         if self.input_folder and self.input_folder.exists():
-            for f in self.input_folder.glob("**/*"):
-                if f.is_file():
-                    self.last_input_scan[str(f)] = f.stat().st_mtime
+            for entry in _iter_files(self.input_folder):
+                self.last_input_scan[sys.intern(entry.path)] = entry.stat().st_mtime
 
         if self.output_folder and self.output_folder.exists():
-            for f in self.output_folder.glob("**/*"):
-                if f.is_file():
-                    self.last_output_scan[str(f)] = f.stat().st_mtime
+            for entry in _iter_files(self.output_folder):
+                self.last_output_scan[sys.intern(entry.path)] = entry.stat().st_mtime
 
     def _check_for_changes(self):
         """Check for new/modified files"""
+        # Skip polling while minimized or hidden; the scan dicts are left
+        # untouched, so changes are picked up on the first poll after restore
+        if self.root.state() == 'iconic' or not self.root.winfo_viewable():
+            return
+
         data_changed = False
         scripts_changed = []
 
         # Check input folder
         if self.input_folder and self.input_folder.exists():
-            for f in self.input_folder.glob("**/*"):
-                if f.is_file():
-                    mtime = f.stat().st_mtime
-                    key = str(f)
-                    if key not in self.last_input_scan or self.last_input_scan[key] != mtime:
-                        self.last_input_scan[key] = mtime
-                        data_changed = True
+            for entry in _iter_files(self.input_folder):
+                mtime = entry.stat().st_mtime
+                key = sys.intern(entry.path)
+                if self.last_input_scan.get(key) != mtime:
+                    self.last_input_scan[key] = mtime
+                    data_changed = True
 
         # Check output folder
         if self.output_folder and self.output_folder.exists():
-            for f in self.output_folder.glob("**/*"):
-                if f.is_file():
-                    mtime = f.stat().st_mtime
-                    key = str(f)
-                    if key not in self.last_output_scan or self.last_output_scan[key] != mtime:
-                        self.last_output_scan[key] = mtime
-                        data_changed = True
+            for entry in _iter_files(self.output_folder):
+                mtime = entry.stat().st_mtime
+                key = sys.intern(entry.path)
+                if self.last_output_scan.get(key) != mtime:
+                    self.last_output_scan[key] = mtime
+                    data_changed = True
 
         # Check scripts folder for auto-run (only when auto-run is enabled)
         if self.auto_run_var.get() and self.scripts_folder and self.scripts_folder.exists():
-            for f in self.scripts_folder.glob("**/*.py"):
-                mtime = f.stat().st_mtime
-                key = str(f)
+            for entry in _iter_files(self.scripts_folder):
+                if not entry.name.endswith(".py"):
+                    continue
+                mtime = entry.stat().st_mtime
+                key = sys.intern(entry.path)
                 if key in self.script_mtimes:
                     if self.script_mtimes[key] != mtime:
                         self.script_mtimes[key] = mtime
@@ -542,25 +1169,43 @@ class ScriptRunner:
                     current_time = time.time()
                     if current_time - self.last_refresh_time > 2:  # Debounce 2 seconds
                         self.last_refresh_time = current_time
-                        self.root.after(0, self._refresh_scripts)
+                        self._post(0, self._refresh_scripts)
+
+        self._notify_changes(data_changed, scripts_changed)
+
+    def _notify_changes(self, data_changed, scripts_changed):
+        """Schedule metadata regeneration and auto-runs on the UI thread"""
+        if data_changed or scripts_changed:
+            self._post(0, lambda: self._queue_pending(data_changed, scripts_changed))
+
+    def _queue_pending(self, data_changed, scripts_changed):
+        """Collect changes and (re)start the debounce timer"""
+        self._pending_data = self._pending_data or data_changed
+        self._pending_scripts.update(scripts_changed)
+
+        # Reset the quiet window on every new change
+        if self._pending_after_id is not None:
+            self.root.after_cancel(self._pending_after_id)
+        self._pending_after_id = self.root.after(DEBOUNCE_MS, self._flush_pending)
+
+    def _flush_pending(self):
+        """Handle all changes collected during the quiet window"""
+        self._pending_after_id = None
+        data_changed, self._pending_data = self._pending_data, False
+        scripts_changed, self._pending_scripts = sorted(self._pending_scripts), set()
 
         # Regenerate metadata if data files changed
         if data_changed:
-            self.root.after(0, lambda: self._log("📁 Data changed → updating metadata"))
-            self.root.after(0, self._generate_metadata)
+            self._log("📁 Data changed → updating metadata")
+            self._generate_metadata()
 
         # Auto-run modified scripts
         for script_path in scripts_changed:
-            script_name = Path(script_path).name
-            self.root.after(0, lambda n=script_name: self._log(f"📝 {n} modified → running"))
-            self.root.after(0, lambda p=script_path: self._run_script(p))
-
-    def _launch_vibefoundry(self):
-        """Open VibeFoundry Assistant in app mode (no URL bar)"""
-        self._log("🚀 Opening VibeFoundry Assistant...")
-        url = "https://vibefoundry.ai/file-preview/"
+            self._log(f"📝 {Path(script_path).name} modified → running")
+            self._run_script(script_path)
 
-        # Try to open in app mode (no URL bar)
+    def _resolve_browser(self):
+        """Find a browser that supports app mode (no URL bar), once"""
         if sys.platform == "darwin":  # macOS
             chrome_paths = [
                 "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
@@ -569,21 +1214,26 @@ class ScriptRunner:
             ]
             for chrome in chrome_paths:
                 if os.path.exists(chrome):
-                    subprocess.Popen([chrome, f"--app={url}"])
-                    self._log("✓ Opened in app mode")
-                    return
+                    return [chrome, "--app={url}"]
         elif sys.platform == "win32":  # Windows
-            import shutil
             chrome = shutil.which("chrome") or shutil.which("google-chrome")
             edge = shutil.which("msedge")
             if chrome:
-                subprocess.Popen([chrome, f"--app={url}"])
-                self._log("✓ Opened in app mode")
-                return
+                return [chrome, "--app={url}"]
             elif edge:
-                subprocess.Popen([edge, f"--app={url}"])
-                self._log("✓ Opened in app mode")
-                return
+                return [edge, "--app={url}"]
+        return None
+
+    def _launch_vibefoundry(self):
+        """Open VibeFoundry Assistant in app mode (no URL bar)"""
+        self._log("🚀 Opening VibeFoundry Assistant...")
+        url = "https://vibefoundry.ai/file-preview/"
+
+        # Try to open in app mode (no URL bar)
+        if self._browser_cmd:
+            subprocess.Popen([part.format(url=url) for part in self._browser_cmd])
+            self._log("✓ Opened in app mode")
+            return
 
         # Fallback to regular browser
         webbrowser.open(url)
@@ -591,7 +1241,19 @@ class ScriptRunner:
 
     def _on_close(self):
         """Clean up on window close"""
+        with self._procs_lock:
+            self._closing = True
+            running = list(self._running_procs)
+            parse_pool, self._parse_pool = self._parse_pool, None
         self.watching = False
+        self._stop_observers()
+        self._work_q.put(None)
+        # Stop running scripts so the pool's threads don't hold up exit
+        for proc in running:
+            proc.kill()
+        self._script_pool.shutdown(wait=False, cancel_futures=True)
+        if parse_pool is not None:
+            self._stop_parse_pool(parse_pool)
         self.root.destroy()
 
     def run(self):
@@ -601,11 +1263,19 @@ class ScriptRunner:
 
 def check_and_install_deps():
     """Check for optional dependencies and offer to install them"""
-    if not HAS_PANDAS and sys.stdout.isatty():
-        print("pandas is recommended for metadata generation.")
+    recommended = [
+        ("pandas", HAS_PANDAS, "metadata generation"),
+        ("watchdog", HAS_WATCHDOG, "instant, low-CPU change detection"),
+    ]
+    missing = [name for name, installed, _ in recommended if not installed]
+
+    if missing and sys.stdout.isatty():
+        for name, installed, purpose in recommended:
+            if not installed:
+                print(f"{name} is recommended for {purpose}.")
         response = input("Install it now? [y/N]: ").strip().lower()
         if response == 'y':
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pandas"])
+            subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
             print("Installed! Please restart.")
             sys.exit(0)
 